@@ -14,6 +14,7 @@ from PyQt5.QtWebEngineWidgets import QWebEngineView
 from services.SetupService import SetupService
 from wizards.SetupWizard import run_setup_wizard
 from services.WifiService import WifiService, SimulatedWifiService
+from services.TouchService import TouchService
 import ctypes
 
 class MainWindow(QWidget):
@@ -25,6 +26,7 @@ class MainWindow(QWidget):
         self.is_raspberry_pi = platform.machine().startswith('aarch64')
         self.wifi_service = WifiService() if self.is_raspberry_pi else SimulatedWifiService()
         self.dev_mode = dev_mode
+        self.touch_service = TouchService(self.is_raspberry_pi, report=dev_mode)
 
         if not self.setup_service.is_setup_complete():
             if not self.run_setup_wizard():
@@ -34,7 +36,7 @@ class MainWindow(QWidget):
         self.initUI()
 
     def run_setup_wizard(self):
-        return run_setup_wizard(self.setup_service)
+        return run_setup_wizard(self.setup_service, self.touch_service)
 
     def initUI(self):
         # Load Press Start 2P font
@@ -96,6 +98,9 @@ class MainWindow(QWidget):
         # Set the initial page
         self.content_area.setCurrentIndex(0)
 
+        # Kinetic touch scrolling for every page
+        self.touch_service.apply(self.content_area)
+
         # Connect buttons to switch pages
         for i, button in enumerate(nav_buttons):
             nav_bar.itemAt(i).widget().clicked.connect(lambda checked, index=i: self.switch_page(index))
@@ -184,6 +189,7 @@ class MainWindow(QWidget):
             self.update_styles()
             self.content_area.removeWidget(self.content_area.widget(0))
             self.add_home_page()
+            self.touch_service.apply(self.content_area)
             self.content_area.setCurrentIndex(0)
 
     def add_wifi_page(self):
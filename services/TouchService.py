@@ -0,0 +1,163 @@
+# Copyright (c) 2024 emSircut
+# This software is released under the MIT License.
+# https://opensource.org/licenses/MIT
+
+import time
+from collections import deque
+from PyQt5.QtWidgets import QAbstractScrollArea, QAbstractItemView, QScroller, QScrollerProperties
+from PyQt5.QtCore import QObject, QEvent
+
+# Kinetic scrolling tuned for the HyperPixel 4.0" panel (60 Hz, small screen)
+SCROLL_METRICS = {
+    QScrollerProperties.FrameRate: QScrollerProperties.Fps60,
+    QScrollerProperties.DragStartDistance: 0.002,  # Start scrolling after ~2mm of travel
+    QScrollerProperties.MousePressEventDelay: 0.05,  # Don't hold back taps on list items
+    QScrollerProperties.DecelerationFactor: 0.3,
+    QScrollerProperties.MaximumVelocity: 0.6,
+    QScrollerProperties.AcceleratingFlickMaximumTime: 0.2,
+    QScrollerProperties.SnapTime: 0.2,
+    QScrollerProperties.OvershootDragResistanceFactor: 0.3,
+    QScrollerProperties.OvershootDragDistanceFactor: 0.1,
+    QScrollerProperties.OvershootScrollDistanceFactor: 0.1,
+    QScrollerProperties.OvershootScrollTime: 0.3,
+}
+
+SCROLLING_STATES = (QScroller.Dragging, QScroller.Scrolling)
+SAMPLE_COUNT = 120  # Roughly two seconds of frames at 60 fps
+FRAME_BUDGET = 1 / 60
+# Longer gaps mean the scroller was idle (e.g. finger held still), not a slow frame
+MAX_FRAME_INTERVAL = 2 * FRAME_BUDGET
+
+
+class ScrollLatencyMonitor(QObject):
+    """Records scroll-to-paint latency and frame intervals for each viewport's latest scroll.
+
+    The flick gesture consumes touch and mouse moves before any event filter sees
+    them, so timing starts at the QScrollEvent the scroller sends for each new
+    position and ends when the viewport's paint event is dispatched.
+    """
+
+    def __init__(self, report=False):
+        super().__init__()
+        self.report = report
+        self.pending = {}
+        self.last_paint = {}
+        self.scrolling = set()
+        self.latencies = {}
+        self.frame_intervals = {}
+        self.last_viewport = None
+
+    def watch(self, viewport):
+        viewport.installEventFilter(self)
+        QScroller.scroller(viewport).stateChanged.connect(
+            lambda state, viewport=viewport: self.on_scroller_state_changed(viewport, state))
+
+    def eventFilter(self, obj, event):
+        if obj not in self.scrolling:
+            return False
+
+        event_type = event.type()
+        if event_type == QEvent.Scroll:
+            # Keep the first position of a frame so the latency covers the whole wait
+            self.pending.setdefault(obj, time.perf_counter())
+        elif event_type == QEvent.Paint:
+            scrolled_at = self.pending.pop(obj, None)
+            if scrolled_at is None:
+                # Not caused by a scroll position change (e.g. item highlight)
+                return False
+            now = time.perf_counter()
+            self.latencies[obj].append(now - scrolled_at)
+            last_paint = self.last_paint.get(obj)
+            if last_paint is not None and now - last_paint <= MAX_FRAME_INTERVAL:
+                self.frame_intervals[obj].append(now - last_paint)
+            self.last_paint[obj] = now
+        return False
+
+    def on_scroller_state_changed(self, viewport, state):
+        was_scrolling = viewport in self.scrolling
+        self.pending.pop(viewport, None)
+
+        if state in SCROLLING_STATES:
+            if not was_scrolling:
+                # A new scroll starts with fresh samples and no previous frame
+                self.scrolling.add(viewport)
+                self.last_paint.pop(viewport, None)
+                self.latencies[viewport] = deque(maxlen=SAMPLE_COUNT)
+                self.frame_intervals[viewport] = deque(maxlen=SAMPLE_COUNT)
+                self.last_viewport = viewport
+            return
+
+        self.scrolling.discard(viewport)
+        self.last_paint.pop(viewport, None)
+        if was_scrolling and self.report:
+            self.print_stats(viewport)
+
+    def get_stats(self, viewport=None):
+        if viewport is None:
+            viewport = self.last_viewport
+        latencies = self.latencies.get(viewport)
+        frame_intervals = self.frame_intervals.get(viewport)
+
+        stats = {"latency_avg_ms": None, "latency_max_ms": None, "fps": None}
+        if latencies:
+            stats["latency_avg_ms"] = sum(latencies) / len(latencies) * 1000
+            stats["latency_max_ms"] = max(latencies) * 1000
+        if frame_intervals:
+            stats["fps"] = len(frame_intervals) / sum(frame_intervals)
+        return stats
+
+    def print_stats(self, viewport=None):
+        stats = self.get_stats(viewport)
+        parts = []
+        if stats["latency_avg_ms"] is not None:
+            parts.append(f"scroll-to-paint avg {stats['latency_avg_ms']:.1f} ms, "
+                         f"max {stats['latency_max_ms']:.1f} ms")
+        if stats["fps"] is not None:
+            parts.append(f"{stats['fps']:.1f} fps")
+        if parts:
+            print(f"Last scroll: {', '.join(parts)}")
+
+
+class TouchService:
+    def __init__(self, is_raspberry_pi, report=False):
+        self.is_raspberry_pi = is_raspberry_pi
+        self.latency_monitor = ScrollLatencyMonitor(report)
+
+    def apply(self, root):
+        # Enable kinetic scrolling on every scroll area below root, including root itself
+        scroll_areas = root.findChildren(QAbstractScrollArea)
+        if isinstance(root, QAbstractScrollArea):
+            scroll_areas.append(root)
+        # QWebEngineView is not a scroll area and handles its own touch input.
+        # Taps on buttons and list items still arrive as Qt's synthesized mouse
+        # events, since the stock widgets only react to mouse input.
+        for scroll_area in scroll_areas:
+            self.enable_kinetic_scrolling(scroll_area)
+
+    def enable_kinetic_scrolling(self, scroll_area):
+        viewport = scroll_area.viewport()
+        if QScroller.hasScroller(viewport):
+            return
+
+        if isinstance(scroll_area, QAbstractItemView):
+            # Per-item steps make kinetic scrolling jump instead of glide
+            scroll_area.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+            scroll_area.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+
+        if self.is_raspberry_pi:
+            # grabGesture also sets WA_AcceptTouchEvents, so the scroll is driven by touch events
+            gesture = QScroller.TouchGesture
+        else:
+            gesture = QScroller.LeftMouseButtonGesture
+        QScroller.grabGesture(viewport, gesture)
+
+        scroller = QScroller.scroller(viewport)
+        properties = scroller.scrollerProperties()
+        for metric, value in SCROLL_METRICS.items():
+            properties.setScrollMetric(metric, value)
+        scroller.setScrollerProperties(properties)
+
+        self.latency_monitor.watch(viewport)
+
+    def get_latency_stats(self):
+        return self.latency_monitor.get_stats()
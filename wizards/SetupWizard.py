@@ -1,10 +1,10 @@
 import sys
-from PyQt5.QtWidgets import QApplication, QWizard, QWizardPage, QLabel, QLineEdit, QVBoxLayout, QComboBox, QCheckBox
+from PyQt5.QtWidgets import QApplication, QWizard, QWizardPage, QLabel, QLineEdit, QVBoxLayout, QComboBox, QCheckBox, QScrollArea, QWidget
 from PyQt5.QtGui import QFont, QFontDatabase
 from PyQt5.QtCore import Qt
 
 class SetupWizard(QWizard):
-    def __init__(self, setup_service):
+    def __init__(self, setup_service, touch_service):
         super().__init__()
         self.setup_service = setup_service
         self.setWindowTitle("ePhone Setup")
@@ -32,6 +32,9 @@ class SetupWizard(QWizard):
         self.addPage(PreferencesPage(self.pixel_font))
         self.addPage(CompletionPage(self.pixel_font))
 
+        # Kinetic touch scrolling for the scrollable page contents
+        touch_service.apply(self)
+
         self.finished.connect(self.on_finished)
 
     def on_finished(self):
@@ -41,7 +44,23 @@ class SetupWizard(QWizard):
             wifi_auto_connect = self.field("wifi_auto_connect")
             self.setup_service.complete_setup(user_name, theme, wifi_auto_connect)
 
-class WelcomePage(QWizardPage):
+class ScrollablePage(QWizardPage):
+    def set_scrollable_layout(self, layout):
+        # Let the 800x480 panel flick through pages taller than the screen
+        content = QWidget()
+        content.setLayout(layout)
+
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setFrameShape(QScrollArea.NoFrame)
+        scroll_area.setWidget(content)
+
+        page_layout = QVBoxLayout()
+        page_layout.setContentsMargins(0, 0, 0, 0)
+        page_layout.addWidget(scroll_area)
+        self.setLayout(page_layout)
+
+class WelcomePage(ScrollablePage):
     def __init__(self, pixel_font):
         super().__init__()
         self.setTitle("Welcome")
@@ -51,9 +70,9 @@ class WelcomePage(QWizardPage):
         label.setWordWrap(True)
         label.setAlignment(Qt.AlignCenter)
         layout.addWidget(label)
-        self.setLayout(layout)
+        self.set_scrollable_layout(layout)
 
-class UserInfoPage(QWizardPage):
+class UserInfoPage(ScrollablePage):
     def __init__(self, pixel_font):
         super().__init__()
         self.setTitle("Your Name")
@@ -69,9 +88,9 @@ class UserInfoPage(QWizardPage):
         layout.addWidget(name_input)
         self.registerField("user_name*", name_input)
 
-        self.setLayout(layout)
+        self.set_scrollable_layout(layout)
 
-class PreferencesPage(QWizardPage):
+class PreferencesPage(ScrollablePage):
     def __init__(self, pixel_font):
         super().__init__()
         self.setTitle("Preferences")
@@ -97,9 +116,9 @@ class PreferencesPage(QWizardPage):
         layout.addWidget(self.wifi_auto_connect)
         self.registerField("wifi_auto_connect", self.wifi_auto_connect)
 
-        self.setLayout(layout)
+        self.set_scrollable_layout(layout)
 
-class CompletionPage(QWizardPage):
+class CompletionPage(ScrollablePage):
     def __init__(self, pixel_font):
         super().__init__()
         self.setTitle("All Set!")
@@ -109,9 +128,9 @@ class CompletionPage(QWizardPage):
         label.setWordWrap(True)
         label.setAlignment(Qt.AlignCenter)
         layout.addWidget(label)
-        self.setLayout(layout)
+        self.set_scrollable_layout(layout)
 
-def run_setup_wizard(setup_service):
-    wizard = SetupWizard(setup_service)
+def run_setup_wizard(setup_service, touch_service):
+    wizard = SetupWizard(setup_service, touch_service)
     result = wizard.exec_()
     return result == QWizard.Accepted